@@ -38,6 +38,12 @@ from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
+# orjson이 설치되어 있으면 C 구현 직렬화기를 사용 (없으면 표준 json으로 대체)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 프로젝트 루트 설정 (절대경로로 고정하여 실행 CWD와 무관하게 저장되도록 함)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -47,6 +53,7 @@ load_dotenv(PROJECT_ROOT / ".env", override=True)
 
 # 로깅 설정
 from src.utils.logging_config import get_logger
+from src.utils.http_client import http_client
 
 logger = get_logger(__name__)
 
@@ -246,36 +253,45 @@ async def run_a2a_deep_research(
 async def check_servers_basic():
     """기본 서버 상태 체크 (MCP + 기본 A2A Supervisor 포트)"""
     # MCP 서버 체크 (3000, 3001, 3002 포트)
-    import socket
-
     mcp_ports = [3000, 3001, 3002]
-    mcp_running = []
 
-    for port in mcp_ports:
+    async def _port_open(port: int) -> bool:
+        # 논블로킹 TCP 연결 시도 (포트별 최대 1초)
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(("localhost", port))
-            sock.close()
-
-            if result == 0:
-                mcp_running.append(port)
-                print(f"✅ MCP 서버 포트 {port}: 실행 중")
-            else:
-                print(f"❌ MCP 서버 포트 {port}: 실행 안됨")
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection("localhost", port), timeout=1
+            )
         except Exception:
-            print(f"❌ MCP 서버 포트 {port}: 연결 실패")
-
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+        return True
 
     # A2A Supervisor 기본 포트(8090) 헬스체크
-    a2a_healthy = False
-    try:
-        import httpx
-        async with httpx.AsyncClient() as client:
+    async def _a2a_healthy() -> bool:
+        try:
+            # 공용 커넥션 풀 재사용 (프로브 지연을 늘리지 않도록 재시도 래퍼 대신 클라이언트 직접 사용)
+            client = http_client.get_client(client_id="http://localhost:8090")
             resp = await client.get("http://localhost:8090/health", timeout=1.5)
-            a2a_healthy = resp.status_code == 200
-    except Exception:
-        a2a_healthy = False
+            return resp.status_code == 200
+        except Exception:
+            return False
+
+    # 포트/헬스 프로브를 동시에 실행 (총 대기 = 가장 느린 프로브 1개)
+    *port_results, a2a_healthy = await asyncio.gather(
+        *(_port_open(port) for port in mcp_ports), _a2a_healthy()
+    )
+
+    mcp_running = []
+    for port, is_open in zip(mcp_ports, port_results):
+        if is_open:
+            mcp_running.append(port)
+            print(f"✅ MCP 서버 포트 {port}: 실행 중")
+        else:
+            print(f"❌ MCP 서버 포트 {port}: 실행 안됨")
 
     print("\n📊 체크 결과:")
     print(f"   MCP 서버: {len(mcp_running)}/{len(mcp_ports)} 개 실행 중")
@@ -394,8 +410,18 @@ async def run_comparison(query: str, endpoints: dict[str, str] | None = None, la
     filename = f"comparison_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     output_path = reports_dir / filename
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(comparison_result, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # orjson은 UTF-8 bytes를 그대로 반환하므로 바이너리 모드로 한 번에 기록
+        with open(output_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    comparison_result,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(comparison_result, f, ensure_ascii=False, indent=2)
 
     print(f"\n💾 상세 결과가 {output_path}에 저장되었습니다.")
     print(f"🏁 실험 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -23,14 +23,13 @@ import sys
 import socket
 from datetime import datetime
 from typing import Dict, Any, List, Tuple, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
 import os
 
 # 프로젝트 루트 디렉토리 설정
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(PROJECT_ROOT)
 
-import httpx
 from langchain_core.messages import HumanMessage
 from dotenv import load_dotenv
 
@@ -39,6 +38,9 @@ from a2a.client import ClientFactory, A2ACardResolver, ClientConfig
 from a2a.client.helpers import create_text_message_object
 from a2a.types import AgentCard, TransportProtocol, Role, Message
 
+# 헬스 체크/카드 조회/스트리밍이 하나의 커넥션 풀을 공유하도록 공용 HTTP 클라이언트 사용
+from src.utils.http_client import http_client
+
 # 프로젝트 루트의 .env 파일 로드 (override=True로 기존 환경변수 덮어쓰기)
 load_dotenv(os.path.join(PROJECT_ROOT, ".env"), override=True)
 
@@ -48,12 +50,17 @@ class PerformanceTracker:
     
     def __init__(self):
         self.events = []
-        self.start_time = time.time()
+        # 구간 측정용 단조 시계 (시스템 시각 변경에 영향받지 않고 해상도가 높음)
+        self.start_time = time.perf_counter()
+    
+    def elapsed(self) -> float:
+        """추적 시작 후 경과 시간(초)"""
+        return time.perf_counter() - self.start_time
     
     def log_event(self, event_type: str, event_name: str, data: Dict[str, Any] = None):
         """이벤트 로그"""
         self.events.append({
-            "timestamp": time.time() - self.start_time,
+            "timestamp": self.elapsed(),
             "type": event_type,
             "name": event_name,
             "data": data or {}
@@ -75,7 +82,7 @@ class PerformanceTracker:
                         break
         
         return {
-            "total_time": time.time() - self.start_time,
+            "total_time": self.elapsed(),
             "stage_times": dict(stage_times),
             "stage_counts": dict(stage_counts),
             "events": self.events
@@ -172,17 +179,20 @@ def is_port_in_use(host: str = "localhost", port: int = 8090) -> bool:
 async def check_server_running(host: str = "localhost", port: int = 8090) -> bool:
     """실행 중인 서버 확인 (헬스 체크)"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"http://{host}:{port}/health", timeout=3.0)
-            return response.status_code == 200
+        response = await http_client.get(f"http://{host}:{port}/health", timeout=3.0)
+        return response.status_code == 200
     except Exception:
         return False
 
 
 async def get_server_status(host: str = "localhost", port: int = 8090) -> Dict[str, Any]:
     """서버 상태 상세 정보"""
-    port_in_use = is_port_in_use(host, port)
-    server_responding = await check_server_running(host, port)
+    # 포트 점유 확인(블로킹 소켓 → 스레드)과 헬스 체크는 서로 독립적이므로 동시에 수행
+    async with asyncio.TaskGroup() as tg:
+        port_task = tg.create_task(asyncio.to_thread(is_port_in_use, host, port))
+        health_task = tg.create_task(check_server_running(host, port))
+    port_in_use = port_task.result()
+    server_responding = health_task.result()
     
     status = {
         "port_in_use": port_in_use,
@@ -288,16 +298,16 @@ async def run_a2a_with_tracking(query: str) -> Tuple[Dict[str, Any], Performance
         
         # A2A Client 생성
         tracker.log_event("stage_start", "client_setup")
-        # httpx.AsyncClient는 with 블록으로 수명 주기를 좁혀 커넥션 누수 방지
-        async with httpx.AsyncClient() as aio:
-            resolver = A2ACardResolver(
-                httpx_client=aio,
-                base_url="http://localhost:8092",
-            )
-            agent_card: AgentCard = await resolver.get_agent_card()
-        # resolver.get_agent_card() 이후에는 ClientFactory가 내부 클라이언트를 관리
+        # 공용 풀의 클라이언트를 카드 조회와 스트리밍 요청에 함께 사용 (핸드셰이크 재사용)
+        aio = http_client.get_client(client_id="http://localhost:8092")
+        resolver = A2ACardResolver(
+            httpx_client=aio,
+            base_url="http://localhost:8092",
+        )
+        agent_card: AgentCard = await resolver.get_agent_card()
         config = ClientConfig(
             streaming=True,
+            httpx_client=aio,
             supported_transports=[TransportProtocol.jsonrpc, TransportProtocol.http_json, TransportProtocol.grpc],
         )
         factory = ClientFactory(config=config)
@@ -325,7 +335,9 @@ async def run_a2a_with_tracking(query: str) -> Tuple[Dict[str, Any], Performance
         )
         
         # A2A 응답 처리 및 추적
-        response_text = ""
+        # 문자열 += 누적 대신 조각 리스트에 모아 마지막에 join (중복 판별은 set으로)
+        response_parts: List[str] = []
+        seen_texts: set[str] = set()
         step_events = []
         
         async for event in client.send_message(message):
@@ -341,8 +353,9 @@ async def run_a2a_with_tracking(query: str) -> Tuple[Dict[str, Any], Performance
                                 root = getattr(part, 'root', None)
                                 text_content = getattr(root, 'text', None)
                                 if isinstance(text_content, str):
-                                    if text_content not in response_text:
-                                        response_text += text_content + "\n"
+                                    if text_content not in seen_texts:
+                                        seen_texts.add(text_content)
+                                        response_parts.append(text_content + "\n")
                 
                 # Task history에서 중간 메시지들 확인 (진행 과정)
                 if hasattr(task, 'history') and task.history:
@@ -355,14 +368,16 @@ async def run_a2a_with_tracking(query: str) -> Tuple[Dict[str, Any], Performance
                         for part in last_message.parts:
                             root = getattr(part, 'root', None)
                             text_content = getattr(root, 'text', None)
-                            if isinstance(text_content, str) and text_content not in response_text:
-                                response_text += text_content + "\n"
+                            if isinstance(text_content, str) and text_content not in seen_texts:
+                                seen_texts.add(text_content)
+                                response_parts.append(text_content + "\n")
                                 step_events.append({
-                                    "timestamp": time.time() - tracker.start_time,
+                                    "timestamp": tracker.elapsed(),
                                     "event": text_content
                                 })
                                 print(f"[A2A 진행] {text_content}")
         
+        response_text = "".join(response_parts)
         tracker.log_event("stage_end", "a2a_request")        
         tracker.log_event("system_end", "A2A_Client")
         
@@ -403,188 +418,199 @@ async def compare_systems():
     print(f"🕐 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 80)
     
-    # A2A 서버 상태 확인 및 시작
-    print("\\n🔵 Deep Research A2A 서버 준비 중...")
-    server_process = await start_deep_research_a2a_server()
-    server_started_by_us = server_process is not None
+    # 서버 확인 단계에서부터 공용 HTTP 커넥션 풀을 사용하므로,
+    # 조기 반환/예외 경로에서도 풀이 정리되도록 전체를 try/finally로 감싼다
+    try:
+        # A2A 서버 상태 확인 및 시작
+        print("\\n🔵 Deep Research A2A 서버 준비 중...")
+        server_process = await start_deep_research_a2a_server()
+        server_started_by_us = server_process is not None
     
-    # 서버 가용성 최종 확인
-    if not await check_server_running():
-        print("❌ A2A 서버를 사용할 수 없습니다 - A2A 비교를 건너뜁니다.")
-        print("💡 해결 방법:")
-        print("   1. 권장: 임베디드 그래프 서버 사용 (start_embedded_graph_server)")
-        print("   2. 포트 8090이 사용 중인지 확인: lsof -i :8090")
-        print("   3. 환경 변수가 올바르게 설정되었는지 확인")
-        return
+        # 서버 가용성 최종 확인
+        if not await check_server_running():
+            print("❌ A2A 서버를 사용할 수 없습니다 - A2A 비교를 건너뜁니다.")
+            print("💡 해결 방법:")
+            print("   1. 권장: 임베디드 그래프 서버 사용 (start_embedded_graph_server)")
+            print("   2. 포트 8090이 사용 중인지 확인: lsof -i :8090")
+            print("   3. 환경 변수가 올바르게 설정되었는지 확인")
+            return
     
-    print("✅ A2A 서버 사용 준비 완료")
-    if not server_started_by_us:
-        print("📝 참고: 기존에 실행 중인 서버를 재사용합니다")
+        print("✅ A2A 서버 사용 준비 완료")
+        if not server_started_by_us:
+            print("📝 참고: 기존에 실행 중인 서버를 재사용합니다")
     
-    try:
-        # LangGraph 실행
-        print("\\n🔴 LangGraph Deep Research 실행 중...")
-        lg_result, lg_tracker = await run_langgraph_with_tracking(query)
-        lg_performance = lg_tracker.get_summary()
-        
-        # 잠시 대기
-        await asyncio.sleep(2)
-        
-        # A2A 실행
-        print("\\n🔵 A2A Deep Research (Client 기반) 실행 중...")
-        a2a_result, a2a_tracker = await run_a2a_with_tracking(query)
-        a2a_performance = a2a_tracker.get_summary()
-        
-        # 보고서 품질 분석
-        print("\\n📊 보고서 품질 분석 중...")
-        lg_quality = ReportQualityAnalyzer.analyze_report(lg_result.get("final_report", ""))
-        a2a_quality = ReportQualityAnalyzer.analyze_report(a2a_result.get("final_report", ""))
-        
-        # 결과 출력
-        print("\\n" + "=" * 80)
-        print("📈 성능 비교 결과")
-        print("=" * 80)
-        
-        # 1. 실행 시간 비교
-        print("\\n⏱️  실행 시간 비교:")
-        print(f"   🔴 LangGraph: {lg_performance['total_time']:.2f}초")
-        if lg_performance['stage_times']:
-            for stage, time in lg_performance['stage_times'].items():
-                print(f"      - {stage}: {time:.2f}초")
-        
-        print(f"\\n   🔵 A2A (Client): {a2a_performance['total_time']:.2f}초")
-        if a2a_performance['stage_times']:
-            for stage, time in a2a_performance['stage_times'].items():
-                print(f"      - {stage}: {time:.2f}초")
-        
-        # A2A 내부 성능 통계 출력
-        if a2a_result.get("performance_stats"):
-            stats = a2a_result["performance_stats"]
-            print("\\n   🔵 A2A 내부 단계별 시간:")
-            for key, value in stats.items():
-                if key.endswith('_time') and isinstance(value, (int, float)):
-                    print(f"      - {key.replace('_time', '')}: {value:.2f}초")
+        try:
+            # LangGraph 실행
+            print("\\n🔴 LangGraph Deep Research 실행 중...")
+            lg_result, lg_tracker = await run_langgraph_with_tracking(query)
+            lg_performance = lg_tracker.get_summary()
+        
+            # 잠시 대기
+            await asyncio.sleep(2)
+        
+            # A2A 실행
+            print("\\n🔵 A2A Deep Research (Client 기반) 실행 중...")
+            a2a_result, a2a_tracker = await run_a2a_with_tracking(query)
+            a2a_performance = a2a_tracker.get_summary()
+        
+            # 보고서 품질 분석
+            print("\\n📊 보고서 품질 분석 중...")
+            lg_quality = ReportQualityAnalyzer.analyze_report(lg_result.get("final_report", ""))
+            a2a_quality = ReportQualityAnalyzer.analyze_report(a2a_result.get("final_report", ""))
+        
+            # 결과 출력
+            print("\\n" + "=" * 80)
+            print("📈 성능 비교 결과")
+            print("=" * 80)
+        
+            # 1. 실행 시간 비교
+            print("\\n⏱️  실행 시간 비교:")
+            print(f"   🔴 LangGraph: {lg_performance['total_time']:.2f}초")
+            if lg_performance['stage_times']:
+                for stage, time in lg_performance['stage_times'].items():
+                    print(f"      - {stage}: {time:.2f}초")
+        
+            print(f"\\n   🔵 A2A (Client): {a2a_performance['total_time']:.2f}초")
+            if a2a_performance['stage_times']:
+                for stage, time in a2a_performance['stage_times'].items():
+                    print(f"      - {stage}: {time:.2f}초")
+        
+            # A2A 내부 성능 통계 출력
+            if a2a_result.get("performance_stats"):
+                stats = a2a_result["performance_stats"]
+                print("\\n   🔵 A2A 내부 단계별 시간:")
+                for key, value in stats.items():
+                    if key.endswith('_time') and isinstance(value, (int, float)):
+                        print(f"      - {key.replace('_time', '')}: {value:.2f}초")
             
-            # 병렬 처리 효과 계산
-            if 'parallel_research_time' in stats and stats['parallel_research_time'] > 0:
-                estimated_sequential = stats['parallel_research_time'] * stats.get('total_researchers', 3)
-                speedup = estimated_sequential / stats['parallel_research_time']
-                print(f"\\n   🚀 병렬 처리 효과: {speedup:.2f}x 속도 향상 (예상)")
-        
-        # 2. 보고서 품질 비교
-        print("\\n📝 보고서 품질 비교:")
-        print("\\n   🔴 LangGraph:")
-        for metric, value in lg_quality.items():
-            print(f"      - {metric}: {value}")
-        
-        print("\\n   🔵 A2A:")
-        for metric, value in a2a_quality.items():
-            print(f"      - {metric}: {value}")
-        
-        # 3. MCP 도구 사용 분석
-        print("\\n🔧 MCP 도구 사용 분석:")
-        print("   🔴 LangGraph:")
-        lg_raw_notes = lg_result.get("raw_notes", [])
-        lg_mcp_usage = analyze_mcp_usage(lg_raw_notes)
-        for tool, count in lg_mcp_usage.items():
-            print(f"      - {tool}: {count}회 사용")
-        
-        print("\\n   🔵 A2A:")
-        a2a_raw_notes = a2a_result.get("raw_research_notes", [])
-        a2a_mcp_usage = analyze_mcp_usage(a2a_raw_notes)
-        for tool, count in a2a_mcp_usage.items():
-            print(f"      - {tool}: {count}회 사용")
-        
-        # 4. 종합 평가
-        print("\\n🏆 종합 평가:")
-        
-        # 속도 우위
-        speed_winner = "LangGraph" if lg_performance['total_time'] < a2a_performance['total_time'] else "A2A"
-        speed_diff = abs(lg_performance['total_time'] - a2a_performance['total_time'])
-        print(f"   ⚡ 속도: {speed_winner}가 {speed_diff:.2f}초 빠름")
-        
-        # 품질 우위
-        lg_score = lg_quality['structure_score'] + (lg_quality['word_count'] / 100)
-        a2a_score = a2a_quality['structure_score'] + (a2a_quality['word_count'] / 100)
-        quality_winner = "LangGraph" if lg_score > a2a_score else "A2A"
-        print(f"   📊 품질 점수: LangGraph({lg_score:.1f}) vs A2A({a2a_score:.1f})")
-        
-        # 상세 결과 저장
-        detailed_results = {
-            "timestamp": datetime.now().isoformat(),
-            "query": query,
-            "langgraph": {
-                "success": lg_result.get("success", False),
-                "performance": lg_performance,
-                "quality": lg_quality,
-                "mcp_usage": lg_mcp_usage,
-                "report_preview": lg_result.get("final_report", "")[:500] + "..." if lg_result.get("final_report") else ""
-            },
-            "a2a": {
-                "success": a2a_result.get("success", False),
-                "performance": a2a_performance,
-                "quality": a2a_quality,
-                "mcp_usage": a2a_mcp_usage,
-                "internal_stats": a2a_result.get("performance_stats", {}),
-                "step_events": a2a_result.get("step_events", []),
-                "report_preview": a2a_result.get("final_report", "")[:500] + "..." if a2a_result.get("final_report") else ""
-            },
-            "comparison": {
-                "speed_winner": speed_winner,
-                "speed_difference": speed_diff,
-                "quality_winner": quality_winner,
-                "lg_quality_score": lg_score,
-                "a2a_quality_score": a2a_score
+                # 병렬 처리 효과 계산
+                if 'parallel_research_time' in stats and stats['parallel_research_time'] > 0:
+                    estimated_sequential = stats['parallel_research_time'] * stats.get('total_researchers', 3)
+                    speedup = estimated_sequential / stats['parallel_research_time']
+                    print(f"\\n   🚀 병렬 처리 효과: {speedup:.2f}x 속도 향상 (예상)")
+        
+            # 2. 보고서 품질 비교
+            print("\\n📝 보고서 품질 비교:")
+            print("\\n   🔴 LangGraph:")
+            for metric, value in lg_quality.items():
+                print(f"      - {metric}: {value}")
+        
+            print("\\n   🔵 A2A:")
+            for metric, value in a2a_quality.items():
+                print(f"      - {metric}: {value}")
+        
+            # 3. MCP 도구 사용 분석
+            print("\\n🔧 MCP 도구 사용 분석:")
+            print("   🔴 LangGraph:")
+            lg_raw_notes = lg_result.get("raw_notes", [])
+            lg_mcp_usage = analyze_mcp_usage(lg_raw_notes)
+            for tool, count in lg_mcp_usage.items():
+                print(f"      - {tool}: {count}회 사용")
+        
+            print("\\n   🔵 A2A:")
+            a2a_raw_notes = a2a_result.get("raw_research_notes", [])
+            a2a_mcp_usage = analyze_mcp_usage(a2a_raw_notes)
+            for tool, count in a2a_mcp_usage.items():
+                print(f"      - {tool}: {count}회 사용")
+        
+            # 4. 종합 평가
+            print("\\n🏆 종합 평가:")
+        
+            # 속도 우위
+            speed_winner = "LangGraph" if lg_performance['total_time'] < a2a_performance['total_time'] else "A2A"
+            speed_diff = abs(lg_performance['total_time'] - a2a_performance['total_time'])
+            print(f"   ⚡ 속도: {speed_winner}가 {speed_diff:.2f}초 빠름")
+        
+            # 품질 우위
+            lg_score = lg_quality['structure_score'] + (lg_quality['word_count'] / 100)
+            a2a_score = a2a_quality['structure_score'] + (a2a_quality['word_count'] / 100)
+            quality_winner = "LangGraph" if lg_score > a2a_score else "A2A"
+            print(f"   📊 품질 점수: LangGraph({lg_score:.1f}) vs A2A({a2a_score:.1f})")
+        
+            # 상세 결과 저장
+            detailed_results = {
+                "timestamp": datetime.now().isoformat(),
+                "query": query,
+                "langgraph": {
+                    "success": lg_result.get("success", False),
+                    "performance": lg_performance,
+                    "quality": lg_quality,
+                    "mcp_usage": lg_mcp_usage,
+                    "report_preview": lg_result.get("final_report", "")[:500] + "..." if lg_result.get("final_report") else ""
+                },
+                "a2a": {
+                    "success": a2a_result.get("success", False),
+                    "performance": a2a_performance,
+                    "quality": a2a_quality,
+                    "mcp_usage": a2a_mcp_usage,
+                    "internal_stats": a2a_result.get("performance_stats", {}),
+                    "step_events": a2a_result.get("step_events", []),
+                    "report_preview": a2a_result.get("final_report", "")[:500] + "..." if a2a_result.get("final_report") else ""
+                },
+                "comparison": {
+                    "speed_winner": speed_winner,
+                    "speed_difference": speed_diff,
+                    "quality_winner": quality_winner,
+                    "lg_quality_score": lg_score,
+                    "a2a_quality_score": a2a_score
+                }
             }
-        }
         
-        # JSON 파일로 저장
-        with open("deep_research_a2a_client_comparison.json", "w", encoding="utf-8") as f:
-            json.dump(detailed_results, f, ensure_ascii=False, indent=2)
+            # JSON 파일로 저장
+            with open("deep_research_a2a_client_comparison.json", "w", encoding="utf-8") as f:
+                json.dump(detailed_results, f, ensure_ascii=False, indent=2)
         
-        print("\\n💾 상세 결과가 deep_research_a2a_client_comparison.json에 저장되었습니다.")
+            print("\\n💾 상세 결과가 deep_research_a2a_client_comparison.json에 저장되었습니다.")
         
-        # 보고서 전문 저장
-        if lg_result.get("final_report"):
-            with open("langgraph_report_client_comparison.md", "w", encoding="utf-8") as f:
-                f.write(lg_result["final_report"])
-            print("📄 LangGraph 보고서가 langgraph_report_client_comparison.md에 저장되었습니다.")
+            # 보고서 전문 저장
+            if lg_result.get("final_report"):
+                with open("langgraph_report_client_comparison.md", "w", encoding="utf-8") as f:
+                    f.write(lg_result["final_report"])
+                print("📄 LangGraph 보고서가 langgraph_report_client_comparison.md에 저장되었습니다.")
         
-        if a2a_result.get("final_report"):
-            with open("a2a_report_client_comparison.md", "w", encoding="utf-8") as f:
-                f.write(a2a_result["final_report"])
-            print("📄 A2A 보고서가 a2a_report_client_comparison.md에 저장되었습니다.")
+            if a2a_result.get("final_report"):
+                with open("a2a_report_client_comparison.md", "w", encoding="utf-8") as f:
+                    f.write(a2a_result["final_report"])
+                print("📄 A2A 보고서가 a2a_report_client_comparison.md에 저장되었습니다.")
     
+        finally:
+            # A2A 서버 종료 (우리가 시작한 서버만)
+            if server_process and server_started_by_us:
+                print("\\n🔵 A2A 서버 종료 중...")
+                server_process.terminate()
+                try:
+                    server_process.wait(timeout=5)
+                    print("✅ A2A 서버가 정상적으로 종료되었습니다")
+                except subprocess.TimeoutExpired:
+                    print("⚠️  서버 종료 타임아웃 - 강제 종료합니다")
+                    server_process.kill()
+                    server_process.wait()
+            elif not server_started_by_us:
+                print("\\n📝 참고: 기존 서버는 그대로 유지됩니다")
     finally:
-        # A2A 서버 종료 (우리가 시작한 서버만)
-        if server_process and server_started_by_us:
-            print("\\n🔵 A2A 서버 종료 중...")
-            server_process.terminate()
-            try:
-                server_process.wait(timeout=5)
-                print("✅ A2A 서버가 정상적으로 종료되었습니다")
-            except subprocess.TimeoutExpired:
-                print("⚠️  서버 종료 타임아웃 - 강제 종료합니다")
-                server_process.kill()
-                server_process.wait()
-        elif not server_started_by_us:
-            print("\\n📝 참고: 기존 서버는 그대로 유지됩니다")
+        # 공용 HTTP 커넥션 풀 정리
+        await http_client.close_all()
+
+
+# 노트에 남는 MCP 도구 태그 (도구명, 태그 표기들)
+_MCP_TOOL_MARKERS = (
+    ("Tavily", ("[Tavily]", "[tavily]")),
+    ("arXiv", ("[arXiv]", "[arxiv]")),
+    ("Serper", ("[Serper]", "[serper]")),
+)
 
 
 def analyze_mcp_usage(notes: List[str]) -> Dict[str, int]:
     """MCP 도구 사용 분석"""
-    usage = {"Tavily": 0, "arXiv": 0, "Serper": 0}
-    
-    for note in notes:
-        if isinstance(note, str):
-            if "[Tavily]" in note or "[tavily]" in note:
-                usage["Tavily"] += 1
-            if "[arXiv]" in note or "[arxiv]" in note:
-                usage["arXiv"] += 1
-            if "[Serper]" in note or "[serper]" in note:
-                usage["Serper"] += 1
-    
-    return usage
+    counts = Counter(
+        tool
+        for note in notes
+        if isinstance(note, str)
+        for tool, markers in _MCP_TOOL_MARKERS
+        if any(marker in note for marker in markers)
+    )
+    # 사용되지 않은 도구도 0으로 표시되도록 고정 키 순서로 반환
+    return {tool: counts[tool] for tool, _ in _MCP_TOOL_MARKERS}
 
 
 if __name__ == "__main__":
@@ -47,6 +47,8 @@ import httpx
 from datetime import datetime
 from dotenv import load_dotenv
 from lg_agents.deep_research.researcher_graph import researcher_graph
+from src.utils.event_loop import uvloop_factory
+from src.utils.http_client import http_client
 
 
 def safe_print(*args, **kwargs):
@@ -511,6 +513,8 @@ async def main():
         safe_print("\n🧹 리소스 정리 단계 진입...")
         await launcher.cleanup_embedded_servers()
         safe_print("✅ 모든 임베디드 서버들이 Context Manager에 의해 안전하게 정리되었습니다.")
+        # 서버 체크/비교 실행에서 사용한 공용 HTTP 커넥션 풀 정리
+        await http_client.close_all()
         safe_print("🔒 포트 자동 해제 및 메모리 정리 완료.")
 
 
@@ -527,11 +531,8 @@ if __name__ == "__main__":
 
     # 필수 환경변수 확인
     required_keys = ["OPENAI_API_KEY"]
-    missing_keys = []
-
-    for key in required_keys:
-        if not os.getenv(key):
-            missing_keys.append(key)
+    env = os.environ
+    missing_keys = [key for key in required_keys if not env.get(key)]
 
     if missing_keys:
         safe_print(f"❌ 필수 환경변수가 설정되지 않았습니다: {', '.join(missing_keys)}")
@@ -543,8 +544,8 @@ if __name__ == "__main__":
     safe_print("✅ 모든 사전 요구사항 확인 완료!")
 
     try:
-        # Step 3 메인 데모 실행
-        asyncio.run(main())
+        # Step 3 메인 데모 실행 (uvloop이 설치되어 있으면 libuv 기반 이벤트 루프 사용)
+        asyncio.run(main(), loop_factory=uvloop_factory())
 
     except KeyboardInterrupt:
         safe_print("\n\n⏹️ 사용자에 의해 데모가 중단되었습니다.")
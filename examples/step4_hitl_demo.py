@@ -60,7 +60,6 @@ from a2a.types import AgentSkill
 
 # HITL 컴포넌트 임포트
 from src.hitl.manager import hitl_manager
-from src.hitl.storage import approval_storage
 
 # A2A 임베디드 서버 유틸 및 HITL 그래프
 from src.a2a_integration.a2a_lg_embedded_server_manager import (
@@ -73,6 +72,7 @@ from src.lg_agents.deep_research.deep_research_agent_a2a import (
 from src.lg_agents.deep_research.supervisor_graph import build_supervisor_subgraph
 from src.lg_agents.deep_research.researcher_graph import researcher_graph
 from src.utils.http_client import http_client
+from src.utils.event_loop import uvloop_factory
 
 A2A_DEFAULT_MODES = ["text/plain", "application/json", "text/markdown"]
 
@@ -103,9 +103,14 @@ async def start_hitl_server():
         )
 
         # 서버 시작 대기 (최대 10초)
-        for i in range(10):
-            await asyncio.sleep(1)
-
+        # 고정 1초 대기 대신 25ms부터 두 배씩 늘리는 지수 백오프(최대 0.5초)로 폴링하여
+        # 서버가 일찍 뜨면 즉시 감지한다. 연결은 공용 http_client 풀을 재사용한다.
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        deadline = started_at + 10
+        delay = 0.025
+        last_reported = 0
+        while loop.time() < deadline:
             # 프로세스가 죽었는지 확인
             if process.poll() is not None:
                 stdout, stderr = process.communicate()
@@ -123,13 +128,19 @@ async def start_hitl_server():
                     timeout=2,
                 )
                 if resp.status_code == 200:
-                    print(f"✅ HITL 웹 서버 정상 시작됨 ({i + 1}초 소요)")
+                    elapsed = loop.time() - started_at
+                    print(f"✅ HITL 웹 서버 정상 시작됨 ({elapsed:.1f}초 소요)")
                     return process
             except Exception:
                 pass
 
-            if i < 5:
-                print(f"   ... 초기화 중 ({i + 1}/10초)")
+            elapsed_sec = int(loop.time() - started_at)
+            if 0 < elapsed_sec <= 5 and elapsed_sec != last_reported:
+                last_reported = elapsed_sec
+                print(f"   ... 초기화 중 ({elapsed_sec}/10초)")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
 
         # 10초 후에도 응답하지 않으면 실패
         print("❌ HITL 서버 시작 타임아웃 (10초)")
@@ -287,8 +298,9 @@ async def check_system_status():
     try:
         import redis.asyncio as aioredis
 
-        r = aioredis.Redis(host="localhost", port=6379)
-        await r.ping()
+        # 상태 확인용 임시 클라이언트는 핑 후 즉시 정리 (연결 누수 방지)
+        async with aioredis.Redis(host="localhost", port=6379) as r:
+            await r.ping()
         print("✅ Redis: 정상")
     except Exception:
         print("❌ Redis: 연결 실패")
@@ -315,22 +327,30 @@ async def check_system_status():
             print("❌ HITL API 자동 시작 실패")
 
     # A2A Agents 확인 (Supervisor:8090, Researcher:8091, Deep(HITL):8092)
-    async def _check(url: str, name: str):
+    # 서로 독립적인 프로브이므로 병렬로 확인하고,
+    # 출력 순서는 유지하기 위해 결과 문자열을 모아서 한 번에 출력한다.
+    async def _check(url: str, name: str) -> str:
         try:
             resp = await http_client.get(
                 url,
                 timeout=5,
             )
             if resp.status_code == 200:
-                print(f"✅ {name}: 정상")
-            else:
-                print(f"❌ {name}: 응답 오류")
+                return f"✅ {name}: 정상"
+            return f"❌ {name}: 응답 오류"
         except Exception:
-            print(f"❌ {name}: 연결 실패")
-
-    await _check("http://localhost:8092/.well-known/agent-card.json", "Supervisor A2A")
-    await _check("http://localhost:8091/.well-known/agent-card.json", "Researcher A2A")
-    await _check("http://localhost:8090/.well-known/agent-card.json", "DeepResearch Control(HITL) A2A")
+            return f"❌ {name}: 연결 실패"
+
+    targets = [
+        ("http://localhost:8092/.well-known/agent-card.json", "Supervisor A2A"),
+        ("http://localhost:8091/.well-known/agent-card.json", "Researcher A2A"),
+        ("http://localhost:8090/.well-known/agent-card.json", "DeepResearch Control(HITL) A2A"),
+    ]
+    # TaskGroup: 구조화된 동시성 (블록을 벗어날 때 모든 프로브가 완료됨을 보장)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_check(url, name)) for url, name in targets]
+    for task in tasks:
+        print(task.result())
 
     return hitl_server_process
 
@@ -341,14 +361,15 @@ async def run_a2a_deep_research_hitl_demo():
     class _Noop:
         async def initialize_hitl_system(self):
             try:
+                # initialize()가 Redis 연결까지 수행하므로 별도 connect()는 불필요
+                # (중복 connect는 기존 연결과 이벤트 구독을 끊어버린다)
                 await hitl_manager.initialize()
-                await approval_storage.connect()
                 return True
             except Exception:
                 return False
         async def cleanup(self):
             try:
-                await approval_storage.disconnect()
+                # shutdown()이 Redis 연결 해제까지 함께 처리
                 await hitl_manager.shutdown()
             except Exception:
                 pass
@@ -410,6 +431,19 @@ async def run_a2a_deep_research_hitl_demo():
                 })
                 return (merged.get("final_report") or "") if isinstance(merged, dict) else ""
 
+        async def _request_report_approval(title: str, description: str, context: dict):
+            """최종 보고서 승인 요청 생성 (초안/개정본 공통 옵션)"""
+            return await hitl_manager.request_approval(
+                agent_id="deep_research_cli",
+                approval_type=ApprovalType.FINAL_REPORT,
+                title=title,
+                description=description,
+                context={"research_topic": topic, **context},
+                options=["승인", "거부"],
+                timeout_seconds=600,
+                priority="high",
+            )
+
         # 3-1) 최종 보고서 생성 먼저 수행
         print(f"\n🔎 연구 주제: {topic}")
         final_report = await _run_deep_research(topic)
@@ -418,19 +452,13 @@ async def run_a2a_deep_research_hitl_demo():
             return False
 
         # 3-2) 최종보고서 승인 요청 생성 (UI에서 상세보기/승인/거절)
-        request = await hitl_manager.request_approval(
-            agent_id="deep_research_cli",
-            approval_type=ApprovalType.FINAL_REPORT,
+        request = await _request_report_approval(
             title="최종 보고서 승인 요청",
             description="CLI 실행 DeepResearch 결과의 최종 승인 요청",
             context={
                 "task_id": "deep_research_cli_task",
-                "research_topic": topic,
                 "final_report": final_report,
             },
-            options=["승인", "거부"],
-            timeout_seconds=600,
-            priority="high",
         )
 
         print("\n⏳ 승인 대기 중... (UI(localhost:8000)에서 승인/거절하세요)")
@@ -449,20 +477,14 @@ async def run_a2a_deep_research_hitl_demo():
             last_final_report = await _run_deep_research(improved_query)
 
             # 새 승인 요청으로 교체
-            request = await hitl_manager.request_approval(
-                agent_id="deep_research_cli",
-                approval_type=ApprovalType.FINAL_REPORT,
+            request = await _request_report_approval(
                 title=f"개정 보고서 승인 요청 (#{revision_count})",
                 description="검토 피드백을 반영한 개정 보고서 승인 요청",
                 context={
                     "task_id": f"deep_research_cli_task_rev_{revision_count}",
-                    "research_topic": topic,
                     "feedback": feedback,
                     "final_report": last_final_report,
                 },
-                options=["승인", "거부"],
-                timeout_seconds=600,
-                priority="high",
             )
             print("⏳ 개정본 승인 대기 중...")
             decision = await hitl_manager.wait_for_approval(request.request_id, auto_approve_on_timeout=False)
@@ -482,7 +504,8 @@ async def run_a2a_deep_research_hitl_demo():
         print(f"\n💥 데모 실행 중 오류 발생: {e}")
         import traceback
 
-        traceback.print_exc()
+        # 스택트레이스를 문자열로 만든 뒤 stderr에 한 번에 기록 (줄 단위 쓰기 대신 단일 write)
+        sys.stderr.write(traceback.format_exc())
         return False
 
     finally:
@@ -567,7 +590,8 @@ if __name__ == "__main__":
     try:
         log_file = _enable_file_logging_for_step(4)
         print(f"📝 로그 파일: {log_file}")
-        asyncio.run(main())
+        # uvloop이 설치되어 있으면 libuv 기반 이벤트 루프 사용
+        asyncio.run(main(), loop_factory=uvloop_factory())
     except KeyboardInterrupt:
         print("\n\n🛑 프로그램이 사용자에 의해 중단되었습니다.")
         print("✅ 안전하게 종료됩니다.")
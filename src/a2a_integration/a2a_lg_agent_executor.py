@@ -45,8 +45,23 @@ class LangGraphWrappedA2AExecutor(AgentExecutor):
         self._extract_result_text = result_extractor or self._default_extract_text
         # 취소 전파를 위한 태스크 ID 집합 (A2A task.id 기준)
         self._cancelled_task_ids: set[str] = set()
+        # 그래프 입력 스키마 필드명 캐시 (컴파일된 그래프의 스키마는 실행 중 바뀌지 않음)
+        self._graph_input_field_names: frozenset[str] | None = None
 
     def _get_graph_input_field_names(self) -> set[str]:
+        """그래프 입력 스키마 필드명을 최초 1회만 리플렉션으로 계산하고 이후 캐시를 반환.
+
+        호출 측이 결과를 수정해도 캐시가 오염되지 않도록 사본(set)을 돌려준다.
+        스키마 조회가 일시적으로 실패하면 빈 집합이 반환되므로, 비어 있지 않은 결과만 캐시한다.
+        """
+        if self._graph_input_field_names is None:
+            field_names = self._compute_graph_input_field_names()
+            if not field_names:
+                return set()
+            self._graph_input_field_names = frozenset(field_names)
+        return set(self._graph_input_field_names)
+
+    def _compute_graph_input_field_names(self) -> set[str]:
         """그래프의 입력 스키마에서 기대하는 필드 이름 집합을 안정적으로 추출.
 
         - Annotated 래핑을 언랩하고 TypedDict/class/dataclass/dict 등을 처리
@@ -634,6 +649,8 @@ class LangGraphWrappedA2AExecutor(AgentExecutor):
             last_emit_ts = 0.0
             last_any_emit_ts = 0.0
             accum_buffer: list[str] = []
+            # 버퍼 누적 길이 (delta마다 sum(len(...))로 재계산하지 않도록 유지)
+            accum_len = 0
             current_task_id = str(thread_id)
 
             gen = self.graph.astream(invoke_input, config=config)
@@ -794,13 +811,14 @@ class LangGraphWrappedA2AExecutor(AgentExecutor):
                         accumulated_text = partial_text
                         if delta:
                             accum_buffer.append(delta)
+                            accum_len += len(delta)
                             now = asyncio.get_event_loop().time()
                             should_flush = False
                             # 조건 1: 최소 간격 초과
                             if (now - last_emit_ts) >= emit_interval:
                                 should_flush = True
                             # 조건 2: 버퍼가 일정 길이 초과
-                            if sum(len(x) for x in accum_buffer) >= min_chars:
+                            if accum_len >= min_chars:
                                 should_flush = True
                             # 조건 3: 최대 지연 제한
                             if (now - last_any_emit_ts) >= max_latency:
@@ -809,6 +827,7 @@ class LangGraphWrappedA2AExecutor(AgentExecutor):
                             if should_flush:
                                 text_to_send = "".join(accum_buffer)
                                 accum_buffer.clear()
+                                accum_len = 0
                                 last_emit_ts = now
                                 last_any_emit_ts = now
                                 if text_to_send:
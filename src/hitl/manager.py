@@ -3,6 +3,8 @@ HITL 매니저 - Human-In-The-Loop 매니저
 """
 import asyncio
 import logging
+import os
+import re
 from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime, timedelta, timezone
 
@@ -13,6 +15,49 @@ from src.utils.http_client import http_client
 
 logger = logging.getLogger(__name__)
 
+# 연구 관련 요청 판별 키워드 (단일 정규식으로 한 번에 대소문자 무시 검색)
+_RESEARCH_KEYWORDS_RE = re.compile(
+    "|".join(["연구", "분석", "조사", "리서치", "research", "analysis", "study"]),
+    re.IGNORECASE,
+)
+
+
+# 보고서 파일 머리말 템플릿 (고정 문구는 모듈 로드 시 한 번만 만들고 가변 필드만 채움)
+_FINAL_REPORT_HEADER = (
+    "# 최종 보고서\n\n"
+    "요청 ID: {request_id}\n"
+    "제목: {title}\n"
+    "시작: {started_at}Z\n"
+    "완료: {completed_at}Z\n\n---\n\n"
+)
+_SNAPSHOT_HEADER = (
+    "# 최종 보고서 스냅샷 ({status})\n\n"
+    "요청 ID: {request_id}\n"
+    "제목: {title}\n"
+    "상태: {status}\n\n---\n\n"
+)
+
+
+def _write_text_file(path: str, *parts: str) -> None:
+    """보고서 파일 기록 (asyncio.to_thread로 호출하여 이벤트 루프 블로킹 방지)
+
+    머리말/본문을 한 번에 UTF-8로 인코딩하여 임시 파일에 기록한 뒤 os.replace로
+    교체한다. 중단되더라도 다른 프로세스가 절반만 쓰인 보고서를 읽는 일이 없다.
+    """
+    data = "".join(parts).encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class HITLManager:
     """Human-In-The-Loop 매니저"""
     
@@ -86,12 +131,10 @@ class HITLManager:
 
     def _is_research_related(self, request: ApprovalRequest) -> bool:
         """연구 관련 승인 요청인지 확인"""
-        research_keywords = [
-            "연구", "분석", "조사", "리서치", "research", "analysis", "study"
-        ]
-        
-        text_to_check = f"{request.title} {request.description}".lower()
-        return any(keyword in text_to_check for keyword in research_keywords)
+        return bool(
+            _RESEARCH_KEYWORDS_RE.search(request.title)
+            or _RESEARCH_KEYWORDS_RE.search(request.description)
+        )
     
     def _extract_research_query(self, request: ApprovalRequest) -> str:
         """승인 요청에서 연구 쿼리 추출"""
@@ -159,25 +202,25 @@ class HITLManager:
                 logger.info("Deep Research 태스크가 취소되었습니다.")
                 return
 
+            # 완료 시각은 한 번만 측정하여 파일명/헤더/브로드캐스트에서 동일하게 사용
+            completed_at = datetime.now()
+
             # 결과 파일 저장 (reports/)
             saved_path = None
             try:
-                import os
                 os.makedirs("reports", exist_ok=True)
-                from datetime import datetime as _dt
-                ts = _dt.now().strftime("%Y%m%d_%H%M%S")
+                ts = completed_at.strftime("%Y%m%d_%H%M%S")
                 filename = f"final_report_{request.request_id}_{ts}.md"
-                header = (
-                    f"# 최종 보고서\n\n"
-                    f"요청 ID: {request.request_id}\n"
-                    f"제목: {request.title}\n"
-                    f"시작: {started_at.isoformat()}Z\n"
-                    f"완료: {_dt.now().isoformat()}Z\n\n---\n\n"
+                header = _FINAL_REPORT_HEADER.format(
+                    request_id=request.request_id,
+                    title=request.title,
+                    started_at=started_at.isoformat(),
+                    completed_at=completed_at.isoformat(),
                 )
                 final_report_text = research_result.get("final_report", "")
-                with open(os.path.join("reports", filename), "w", encoding="utf-8") as f:
-                    f.write(header + final_report_text)
-                saved_path = os.path.join("reports", filename)
+                report_path = os.path.join("reports", filename)
+                await asyncio.to_thread(_write_text_file, report_path, header, final_report_text)
+                saved_path = report_path
             except Exception as e:
                 logger.error(f"최종 보고서 파일 저장 실패: {e}")
 
@@ -186,9 +229,9 @@ class HITLManager:
                 "request_id": request.request_id,
                 "task_id": request.task_id,
                 "success": True,
-                "total_duration": f"{(datetime.now() - started_at).seconds}초",
+                "total_duration": f"{(completed_at - started_at).seconds}초",
                 "started_at": started_at,
-                "completed_at": datetime.now(),
+                "completed_at": completed_at,
                 "final_status": "완료",
                 "summary": research_result.get("summary", "Deep Research가 성공적으로 완료되었습니다."),
                 "final_report": research_result.get("final_report", ""),
@@ -217,79 +260,82 @@ class HITLManager:
             
             logger.info(f"A2A Deep Research 시작: {query}")
             
-            # 공통 HTTP 클라이언트 세션 사용
-            try:
-                # A2A Card Resolver로 agent card 가져오기
-                async with http_client.session() as _hc:
-                    resolver = A2ACardResolver(
-                        httpx_client=_hc,
-                        base_url="http://localhost:8090",
-                    )
-                    agent_card = await resolver.get_agent_card()
-                
-                # Client 설정 및 생성
-                config = ClientConfig(
-                    streaming=True,
-                    supported_transports=[TransportProtocol.jsonrpc, TransportProtocol.http_json],
-                )
-                factory = ClientFactory(config=config)
-                client = factory.create(card=agent_card)
-                
-                # A2A 메시지 생성
-                message = create_text_message_object(
-                    role=Role.user,
-                    content=query
-                )
-                
-                # A2A 서버에 요청 전송 및 결과 수집
-                final_report = ""
-                research_metadata = {}
-                
-                logger.info("A2A 요청 전송 중...")
-                
-                async for event in client.send_message(message):
-                    # A2A 이벤트는 (Task, Event) tuple 구조
-                    if isinstance(event, tuple) and len(event) >= 1:
-                        task = event[0]  # 첫 번째는 Task 객체
-                        
-                        # Task에서 최종 응답 확인
-                        if hasattr(task, 'artifacts') and task.artifacts:
-                            for artifact in task.artifacts:
-                                if hasattr(artifact, 'parts') and artifact.parts:
-                                    for part in artifact.parts:
-                                        if hasattr(part, 'root') and hasattr(part.root, 'text'):
-                                            text_content = part.root.text
-                                            if text_content not in final_report:
-                                                final_report += text_content
-                        
-                        # Task history에서 중간 메시지들 확인
-                        elif hasattr(task, 'history') and task.history:
-                            # 마지막 메시지만 처리 (중복 방지)
-                            last_message = task.history[-1]
-                            if (hasattr(last_message, 'role') and 
-                                last_message.role.value == 'agent' and
-                                hasattr(last_message, 'parts') and last_message.parts):
-                                
-                                for part in last_message.parts:
+            # 공통 HTTP 클라이언트 풀 재사용 (요청마다 새 세션/핸드셰이크를 만들지 않음)
+            # A2A Card Resolver로 agent card 가져오기
+            httpx_client = http_client.get_client(client_id="http://localhost:8090")
+            resolver = A2ACardResolver(
+                httpx_client=httpx_client,
+                base_url="http://localhost:8090",
+            )
+            agent_card = await resolver.get_agent_card()
+            
+            # Client 설정 및 생성 (카드 조회와 동일한 커넥션 풀 사용)
+            config = ClientConfig(
+                streaming=True,
+                httpx_client=httpx_client,
+                supported_transports=[TransportProtocol.jsonrpc, TransportProtocol.http_json],
+            )
+            factory = ClientFactory(config=config)
+            client = factory.create(card=agent_card)
+            
+            # A2A 메시지 생성
+            message = create_text_message_object(
+                role=Role.user,
+                content=query
+            )
+            
+            # A2A 서버에 요청 전송 및 결과 수집
+            # 문자열 += 누적 대신 조각 리스트에 모은 뒤 마지막에 한 번만 join
+            # (중복 판별은 누적 문자열 부분 검색 대신 set으로 O(1) 처리)
+            report_parts: list[str] = []
+            seen_texts: set[str] = set()
+            research_metadata = {}
+            
+            logger.info("A2A 요청 전송 중...")
+            
+            async for event in client.send_message(message):
+                # A2A 이벤트는 (Task, Event) tuple 구조
+                if isinstance(event, tuple) and len(event) >= 1:
+                    task = event[0]  # 첫 번째는 Task 객체
+                    
+                    # Task에서 최종 응답 확인
+                    if hasattr(task, 'artifacts') and task.artifacts:
+                        for artifact in task.artifacts:
+                            if hasattr(artifact, 'parts') and artifact.parts:
+                                for part in artifact.parts:
                                     if hasattr(part, 'root') and hasattr(part.root, 'text'):
                                         text_content = part.root.text
-                                        # 이미 포함된 내용인지 확인
-                                        if text_content not in final_report:
-                                            final_report += text_content + "\n"
-                
-                # 결과 정리
-                return {
-                    "summary": f"'{query}' 주제에 대한 A2A 기반 심층 연구가 완료되었습니다.",
-                    "final_report": final_report.strip(),
-                    "workflow": "a2a_orchestrated",
-                    "metadata": research_metadata,
-                    "notes_count": research_metadata.get("compressed_notes_count", 0),
-                    "messages_count": research_metadata.get("raw_notes_count", 0)
-                }
+                                        if text_content not in seen_texts:
+                                            seen_texts.add(text_content)
+                                            report_parts.append(text_content)
+                    
+                    # Task history에서 중간 메시지들 확인
+                    elif hasattr(task, 'history') and task.history:
+                        # 마지막 메시지만 처리 (중복 방지)
+                        last_message = task.history[-1]
+                        if (hasattr(last_message, 'role') and 
+                            last_message.role.value == 'agent' and
+                            hasattr(last_message, 'parts') and last_message.parts):
+                            
+                            for part in last_message.parts:
+                                if hasattr(part, 'root') and hasattr(part.root, 'text'):
+                                    text_content = part.root.text
+                                    # 이미 포함된 내용인지 확인
+                                    if text_content not in seen_texts:
+                                        seen_texts.add(text_content)
+                                        report_parts.append(text_content + "\n")
             
-            finally:
-                # httpx 클라이언트 정리
-                await http_client.aclose()
+            final_report = "".join(report_parts)
+
+            # 결과 정리
+            return {
+                "summary": f"'{query}' 주제에 대한 A2A 기반 심층 연구가 완료되었습니다.",
+                "final_report": final_report.strip(),
+                "workflow": "a2a_orchestrated",
+                "metadata": research_metadata,
+                "notes_count": research_metadata.get("compressed_notes_count", 0),
+                "messages_count": research_metadata.get("raw_notes_count", 0)
+            }
             
         except Exception as e:
             logger.error(f"A2A Deep Research 실행 오류: {e}")
@@ -568,20 +614,19 @@ class HITLManager:
             report_text = context.get("final_report")
             if not isinstance(report_text, str) or not report_text.strip():
                 return
-            import os
             from datetime import datetime as _dt
             base_dir = os.path.join("reports", "snapshots", status_label)
             os.makedirs(base_dir, exist_ok=True)
             ts = _dt.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{request.request_id}_{ts}.md"
-            header = (
-                f"# 최종 보고서 스냅샷 ({status_label})\n\n"
-                f"요청 ID: {request.request_id}\n"
-                f"제목: {request.title}\n"
-                f"상태: {status_label}\n\n---\n\n"
+            header = _SNAPSHOT_HEADER.format(
+                request_id=request.request_id,
+                title=request.title,
+                status=status_label,
+            )
+            await asyncio.to_thread(
+                _write_text_file, os.path.join(base_dir, filename), header, report_text
             )
-            with open(os.path.join(base_dir, filename), "w", encoding="utf-8") as f:
-                f.write(header + report_text)
         except Exception as e:
             logger.error(f"보고서 스냅샷 저장 오류: {e}")
     
@@ -59,6 +59,9 @@ from .models import ApprovalRequest, ApprovalStatus, ApprovalType
 
 logger = logging.getLogger(__name__)
 
+# 대기 목록 정렬용 우선순위 (알 수 없는 값은 가장 뒤로)
+_PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
 class ApprovalStorage:
     """승인 요청 저장소 (Redis 기반)"""
     
@@ -100,28 +103,31 @@ class ApprovalStorage:
         """승인 요청 생성"""
         key = f"approval:{request.request_id}"
         
-        # Redis에 저장
-        await self._redis.setex(
-            key,
-            timedelta(hours=24),  # 24시간 TTL
-            request.model_dump_json()
-        )
-        
-        # 인덱스 추가
-        await self._redis.sadd("approvals:pending", request.request_id)
-        await self._redis.sadd(f"approvals:agent:{request.agent_id}", request.request_id)
-        await self._redis.sadd(f"approvals:type:{request.approval_type.value}", request.request_id)
-        
-        # 이벤트 발행
-        await self._redis.publish(
-            "approval:created",
-            json.dumps({
-                "request_id": request.request_id,
-                "agent_id": request.agent_id,
-                "type": request.approval_type.value,
-                "priority": request.priority
-            })
-        )
+        # 저장/인덱스/이벤트 명령을 하나의 파이프라인으로 묶어 왕복(RTT)을 1회로 줄인다
+        async with self._redis.pipeline(transaction=False) as pipe:
+            # Redis에 저장
+            pipe.setex(
+                key,
+                timedelta(hours=24),  # 24시간 TTL
+                request.model_dump_json()
+            )
+            
+            # 인덱스 추가
+            pipe.sadd("approvals:pending", request.request_id)
+            pipe.sadd(f"approvals:agent:{request.agent_id}", request.request_id)
+            pipe.sadd(f"approvals:type:{request.approval_type.value}", request.request_id)
+            
+            # 이벤트 발행
+            pipe.publish(
+                "approval:created",
+                json.dumps({
+                    "request_id": request.request_id,
+                    "agent_id": request.agent_id,
+                    "type": request.approval_type.value,
+                    "priority": request.priority
+                })
+            )
+            await pipe.execute()
         
         logger.info(f"승인 요청 생성: {request.request_id}")
         return request.request_id
@@ -155,32 +161,62 @@ class ApprovalStorage:
         request.decision = decision
         request.decision_reason = reason
         
-        # Redis 업데이트
+        # Redis 업데이트 (파이프라인으로 한 번에 전송)
         key = f"approval:{request_id}"
-        await self._redis.setex(
-            key,
-            timedelta(hours=24),
-            request.model_dump_json()
-        )
-        
-        # 인덱스 업데이트
-        await self._redis.srem("approvals:pending", request_id)
-        await self._redis.sadd(f"approvals:{status.value}", request_id)
-        
-        # 이벤트 발행
-        await self._redis.publish(
-            f"approval:{status.value}",
-            json.dumps({
-                "request_id": request_id,
-                "status": status.value,
-                "decided_by": decided_by,
-                "decision": decision
-            })
-        )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.setex(
+                key,
+                timedelta(hours=24),
+                request.model_dump_json()
+            )
+            
+            # 인덱스 업데이트
+            pipe.srem("approvals:pending", request_id)
+            pipe.sadd(f"approvals:{status.value}", request_id)
+            
+            # 이벤트 발행
+            pipe.publish(
+                f"approval:{status.value}",
+                json.dumps({
+                    "request_id": request_id,
+                    "status": status.value,
+                    "decided_by": decided_by,
+                    "decision": decision
+                })
+            )
+            await pipe.execute()
         
         logger.info(f"승인 상태 업데이트: {request_id} -> {status.value}")
         return True
     
+    async def _load_requests(self, request_ids: List[bytes]) -> List[ApprovalRequest]:
+        """여러 승인 요청을 MGET 한 번으로 로드 (만료되어 사라진 키는 건너뜀)"""
+        if not request_ids:
+            return []
+        keys = [f"approval:{rid.decode() if isinstance(rid, bytes) else rid}" for rid in request_ids]
+        rows = await self._redis.mget(keys)
+        return [ApprovalRequest.model_validate_json(data) for data in rows if data]
+
+    async def _filtered_ids(
+        self,
+        status_key: str,
+        agent_id: Optional[str] = None,
+        approval_type: Optional[ApprovalType] = None,
+    ) -> set:
+        """상태 인덱스와 에이전트/타입 인덱스의 교집합 ID 조회
+
+        필터가 있으면 SINTER로 Redis 측에서 교집합을 계산하여
+        전체 집합을 내려받아 파이썬에서 교차하는 비용을 없앤다.
+        """
+        keys = [status_key]
+        if agent_id:
+            keys.append(f"approvals:agent:{agent_id}")
+        if approval_type:
+            keys.append(f"approvals:type:{approval_type.value}")
+        if len(keys) == 1:
+            return await self._redis.smembers(status_key)
+        return await self._redis.sinter(keys)
+
     async def get_pending_approvals(
         self,
         agent_id: Optional[str] = None,
@@ -188,28 +224,14 @@ class ApprovalStorage:
         limit: int = 100
     ) -> List[ApprovalRequest]:
         """대기 중인 승인 요청 조회"""
-        # 기본 대기 목록
-        pending_ids = await self._redis.smembers("approvals:pending")
-        
-        # 필터링
-        if agent_id:
-            agent_ids = await self._redis.smembers(f"approvals:agent:{agent_id}")
-            pending_ids = pending_ids.intersection(agent_ids)
+        # 기본 대기 목록 (+ 에이전트/타입 필터링)
+        pending_ids = await self._filtered_ids("approvals:pending", agent_id, approval_type)
         
-        if approval_type:
-            type_ids = await self._redis.smembers(f"approvals:type:{approval_type.value}")
-            pending_ids = pending_ids.intersection(type_ids)
-        
-        # 요청 로드
-        requests = []
-        for request_id in list(pending_ids)[:limit]:
-            request = await self.get_approval_request(request_id.decode())
-            if request:
-                requests.append(request)
+        # 요청 로드 (MGET 1회)
+        requests = await self._load_requests(list(pending_ids)[:limit])
         
         # 우선순위 정렬
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        requests.sort(key=lambda r: (priority_order.get(r.priority, 4), r.created_at))
+        requests.sort(key=lambda r: (_PRIORITY_ORDER.get(r.priority, 4), r.created_at))
         
         return requests
 
@@ -220,24 +242,11 @@ class ApprovalStorage:
         limit: int = 100
     ) -> List[ApprovalRequest]:
         """승인된 승인 요청 조회"""
-        # 기본 승인 목록
-        approved_ids = await self._redis.smembers("approvals:approved")
+        # 기본 승인 목록 (+ 에이전트/타입 필터링)
+        approved_ids = await self._filtered_ids("approvals:approved", agent_id, approval_type)
         
-        # 필터링
-        if agent_id:
-            agent_ids = await self._redis.smembers(f"approvals:agent:{agent_id}")
-            approved_ids = approved_ids.intersection(agent_ids)
-        
-        if approval_type:
-            type_ids = await self._redis.smembers(f"approvals:type:{approval_type.value}")
-            approved_ids = approved_ids.intersection(type_ids)
-        
-        # 요청 로드
-        requests = []
-        for request_id in list(approved_ids)[:limit]:
-            request = await self.get_approval_request(request_id.decode())
-            if request:
-                requests.append(request)
+        # 요청 로드 (MGET 1회)
+        requests = await self._load_requests(list(approved_ids)[:limit])
         
         # 결정 시간 기준 역순 정렬 (최신 승인부터)
         requests.sort(key=lambda r: r.decided_at or r.created_at, reverse=True)
@@ -251,24 +260,11 @@ class ApprovalStorage:
         limit: int = 100
     ) -> List[ApprovalRequest]:
         """거부된 승인 요청 조회"""
-        # 기본 거부 목록
-        rejected_ids = await self._redis.smembers("approvals:rejected")
-        
-        # 필터링
-        if agent_id:
-            agent_ids = await self._redis.smembers(f"approvals:agent:{agent_id}")
-            rejected_ids = rejected_ids.intersection(agent_ids)
-        
-        if approval_type:
-            type_ids = await self._redis.smembers(f"approvals:type:{approval_type.value}")
-            rejected_ids = rejected_ids.intersection(type_ids)
+        # 기본 거부 목록 (+ 에이전트/타입 필터링)
+        rejected_ids = await self._filtered_ids("approvals:rejected", agent_id, approval_type)
         
-        # 요청 로드
-        requests = []
-        for request_id in list(rejected_ids)[:limit]:
-            request = await self.get_approval_request(request_id.decode())
-            if request:
-                requests.append(request)
+        # 요청 로드 (MGET 1회)
+        requests = await self._load_requests(list(rejected_ids)[:limit])
         
         # 결정 시간 기준 역순 정렬 (최신 거부부터)
         requests.sort(key=lambda r: r.decided_at or r.created_at, reverse=True)
@@ -280,19 +276,18 @@ class ApprovalStorage:
         expired = []
         pending_ids = await self._redis.smembers("approvals:pending")
         
-        for request_id in pending_ids:
-            request = await self.get_approval_request(request_id.decode())
-            if request and request.expires_at:
+        for request in await self._load_requests(list(pending_ids)):
+            if request.expires_at:
                 if datetime.utcnow() > request.expires_at:
                     # 타임아웃 처리
                     await self.update_approval_status(
-                        request_id.decode(),
+                        request.request_id,
                         ApprovalStatus.TIMEOUT,
                         decided_by="system",
                         decision="timeout",
                         reason="승인 요청 시간 초과"
                     )
-                    expired.append(request_id.decode())
+                    expired.append(request.request_id)
         
         return expired
     
@@ -42,8 +42,11 @@ class WebhookEventStorage:
             data = json.dumps(payload, ensure_ascii=False)
         except Exception:
             data = json.dumps({"raw": str(payload)})
-        await self._redis.rpush(key, data)
-        await self._redis.expire(key, self.ttl_seconds)
+        # RPUSH + EXPIRE를 파이프라인으로 묶어 왕복 1회로 처리
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, data)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
 
     async def get_events(self, task_id: str, limit: int = 100) -> List[Any]:
         if self._redis is None:
@@ -10,9 +10,11 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List
+import json
 import logging
 from pathlib import Path
-from datetime import timezone
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
 
 from hitl.manager import hitl_manager
 from src.utils.http_client import http_client, cleanup_http_clients
@@ -119,19 +121,19 @@ async def hitl_dashboard_alias():
 @app.get("/api/a2a/status")
 async def get_a2a_status():
     """A2A(8090) 상태 점검: 에이전트 카드/헬스체크를 프록시로 확인"""
+    import asyncio
     from datetime import datetime
 
     base_url = "http://localhost:8090"
-    agent = None
-    healthy = False
     errors: list[str] = []
-    try:
+
+    async def _fetch_card():
         # Agent Card 확인
         try:
             resp = await http_client.get(f"{base_url}/.well-known/agent-card.json", timeout=1.5)
             if resp.status_code == 200:
                 data = resp.json()
-                agent = {
+                return {
                     "name": data.get("name"),
                     "description": data.get("description"),
                     "version": data.get("version"),
@@ -139,13 +141,22 @@ async def get_a2a_status():
                 }
         except Exception as e:
             errors.append(f"card:{type(e).__name__}")
+        return None
 
+    async def _fetch_health() -> bool:
         # Health 확인
         try:
             resp_h = await http_client.get(f"{base_url}/health", timeout=1.0)
-            healthy = resp_h.status_code == 200
+            return resp_h.status_code == 200
         except Exception as e:
             errors.append(f"health:{type(e).__name__}")
+        return False
+
+    # 카드/헬스 프로브는 서로 독립적이므로 동시에 요청 (총 대기 = 둘 중 긴 쪽)
+    agent = None
+    healthy = False
+    try:
+        agent, healthy = await asyncio.gather(_fetch_card(), _fetch_health())
     except Exception as e:
         errors.append(f"root:{type(e).__name__}")
 
@@ -273,6 +284,25 @@ async def get_approval_final_report(request_id: str):
     return {"request_id": request_id, "final_report": report}
 
 
+def _report_json_default(obj):
+    """보고서 JSON 직렬화 보조 (datetime은 ISO 8601, 그 외 비호환 값은 문자열)"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps_report_json(payload: dict) -> bytes | str:
+    """보고서 다운로드용 JSON 직렬화 (orjson이 있으면 C 구현 사용, 없으면 표준 json)"""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(
+            payload, ensure_ascii=False, indent=2, default=_report_json_default
+        )
+    # 두 경로 모두 같은 default 훅을 사용해 비호환 값 처리 결과를 맞춘다
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=_report_json_default)
+
+
 @app.get("/api/approvals/{request_id}/final-report/download")
 async def download_approval_final_report(request_id: str, format: str = "md"):
     """최종 보고서를 파일로 다운로드
@@ -280,8 +310,6 @@ async def download_approval_final_report(request_id: str, format: str = "md"):
     - format: md | txt | json (기본 md)
     """
     from hitl.storage import approval_storage
-    import json as json_lib
-    from datetime import datetime
 
     request = await approval_storage.get_approval_request(request_id)
     if not request:
@@ -305,7 +333,7 @@ async def download_approval_final_report(request_id: str, format: str = "md"):
             "created_at": getattr(request, "created_at", None),
             "decided_at": getattr(request, "decided_at", None),
         }
-        content = json_lib.dumps(payload, ensure_ascii=False, indent=2)
+        content = _dumps_report_json(payload)
         media_type = "application/json"
         filename = f"final_report_{request_id}_{ts}.json"
     else:
@@ -486,15 +514,16 @@ async def start_deep_research(request: ResearchStartRequest):
         # TODO: 이 부분은 나중에 상태 관리 로직으로 개선 필요
         
         # ApprovalRequest 모의 객체 생성 (HITLManager와 일관된 인터페이스)
-        mock_request = type('MockRequest', (), {
-            'request_id': request.request_id or str(uuid.uuid4()),
-            'task_id': f"user_research_{str(uuid.uuid4())[:8]}",
-            'title': f"사용자 요청 연구: {topic}",
-            'description': f"사용자가 직접 요청한 DeepResearch: {topic}",
-            'agent_id': "user_direct_research_agent",
-            'approval_type': "RESEARCH_REQUEST",
-            'context': {"user_topic": topic, "direct_request": True}
-        })()
+        # 요청마다 새 클래스를 만드는 type(...) 대신 가벼운 SimpleNamespace 사용
+        mock_request = SimpleNamespace(
+            request_id=request.request_id or str(uuid.uuid4()),
+            task_id=f"user_research_{str(uuid.uuid4())[:8]}",
+            title=f"사용자 요청 연구: {topic}",
+            description=f"사용자가 직접 요청한 DeepResearch: {topic}",
+            agent_id="user_direct_research_agent",
+            approval_type="RESEARCH_REQUEST",
+            context={"user_topic": topic, "direct_request": True},
+        )
         
         # HITLManager의 연구 실행 로직 호출
         from src.hitl.manager import hitl_manager
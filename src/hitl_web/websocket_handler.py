@@ -4,6 +4,7 @@ HITL WebSocket 핸들러 - 실시간 알림
 
 import json
 import asyncio
+from datetime import date, datetime
 from src.utils.logging_config import get_logger
 from typing import Set, Dict, Any
 from fastapi import WebSocket, WebSocketDisconnect
@@ -14,11 +15,20 @@ from hitl.manager import hitl_manager
 logger = get_logger(__name__)
 
 
+def _json_default(obj: Any) -> str:
+    """브로드캐스트 페이로드 직렬화 보조 (datetime 등 JSON 비호환 값 처리)"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
 class WebSocketManager:
     """WebSocket 연결 관리자"""
 
-    def __init__(self):
+    def __init__(self, max_concurrent_sends: int = 64):
         self.active_connections: Set[WebSocket] = set()
+        # 브로드캐스트 시 동시에 진행되는 전송 수 상한 (연결 수가 많아도 태스크 폭주 방지)
+        self._send_semaphore = asyncio.Semaphore(max_concurrent_sends)
 
     async def connect(self, websocket: WebSocket):
         """WebSocket 연결"""
@@ -49,18 +59,22 @@ class WebSocketManager:
 
         connections = list(self.active_connections)
 
+        # 연결마다 직렬화하지 않도록 메시지를 한 번만 JSON 텍스트로 변환 (send_json과 동일 포맷)
+        try:
+            payload = json.dumps(
+                message, ensure_ascii=False, separators=(",", ":"), default=_json_default
+            )
+        except (TypeError, ValueError) as e:
+            logger.error(f"브로드캐스트 메시지 직렬화 실패: {e}")
+            return
+
         async def _send(conn: WebSocket):
-            try:
-                async def _send_once():
-                    try:
-                        await conn.send_json(message)
-                    except Exception:
-                        await conn.send_text(json.dumps(message))
-
-                await asyncio.wait_for(_send_once(), timeout=2.0)
-                return None
-            except Exception as e:
-                return e
+            async with self._send_semaphore:
+                try:
+                    await asyncio.wait_for(conn.send_text(payload), timeout=2.0)
+                    return None
+                except Exception as e:
+                    return e
 
         tasks = [asyncio.create_task(_send(conn)) for conn in connections]
         results = await asyncio.gather(*tasks, return_exceptions=True)
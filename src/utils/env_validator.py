@@ -23,6 +23,10 @@ from src.utils.logging_config import get_logger
 # 로깅 설정
 logger = get_logger(__name__)
 
+# 허용 값 집합 (검증 호출마다 리스트를 새로 만들지 않도록 모듈 상수로 유지)
+_VALID_ENVIRONMENTS = frozenset({"development", "staging", "production", "test"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
 
 class EnvVarType(Enum):
     """환경 변수 타입 정의"""
@@ -214,11 +218,11 @@ class EnvironmentValidator:
     
     def _validate_environment(self, value: str) -> bool:
         """환경 값 검증"""
-        return value in ["development", "staging", "production", "test"]
+        return value in _VALID_ENVIRONMENTS
     
     def _validate_log_level(self, value: str) -> bool:
         """로그 레벨 검증"""
-        return value.upper() in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+        return value.upper() in _VALID_LOG_LEVELS
     
     def _validate_port(self, value: str) -> bool:
         """포트 번호 검증"""
@@ -254,9 +258,12 @@ class EnvironmentValidator:
             "invalid_format": []
         }
         
+        # os.environ 매핑을 한 번만 조회해 지역 변수로 재사용
+        env = os.environ
+
         # 필수 변수 검증
         for name, spec in self.env_specs.items():
-            value = os.getenv(name, spec.default)
+            value = env.get(name, spec.default)
             
             if spec.var_type == EnvVarType.REQUIRED:
                 if not value:
@@ -277,7 +284,7 @@ class EnvironmentValidator:
         
         # 조건부 필수 변수 검증 (검색 API 키)
         search_keys = ["TAVILY_API_KEY", "SERPER_API_KEY"]
-        has_search_key = any(os.getenv(key) for key in search_keys)
+        has_search_key = any(env.get(key) for key in search_keys)
         
         if not has_search_key:
             errors.append("검색 API 키가 최소 하나 필요합니다 (TAVILY_API_KEY 또는 SERPER_API_KEY)")
@@ -359,8 +366,9 @@ class EnvironmentValidator:
         }
         
         # API 키 상태
-        for key in ["OPENAI_API_KEY", "TAVILY_API_KEY", "SERPER_API_KEY", "ANTHROPIC_API_KEY"]:
-            value = os.getenv(key)
+        env = os.environ
+        for key in ("OPENAI_API_KEY", "TAVILY_API_KEY", "SERPER_API_KEY", "ANTHROPIC_API_KEY"):
+            value = env.get(key)
             if value:
                 summary["api_keys"][key] = "✅ 설정됨 " + self._mask_sensitive(value)
             else:
@@ -0,0 +1,17 @@
+"""
+이벤트 루프 유틸리티 모듈
+
+예제 진입점에서 `asyncio.run(..., loop_factory=...)`에 넘길 이벤트 루프 팩토리를 제공합니다.
+"""
+
+from typing import Callable, Optional
+import asyncio
+
+
+def uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """uvloop 이벤트 루프 팩토리 반환 (미설치/미지원 플랫폼이면 None → 기본 루프)"""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
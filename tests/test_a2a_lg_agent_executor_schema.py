@@ -4,15 +4,8 @@ LangGraphWrappedA2AExecutor의 TypedDict/Annotated 스키마 처리 테스트
 이 테스트는 다양한 스키마 타입(TypedDict, Annotated, 중첩 구조 등)에서
 _get_graph_input_field_names() 메서드가 올바르게 필드명을 추출하는지 검증합니다.
 """
-import os
-import sys
 import pytest
 
-# tests가 repo 루트에서 실행될 때 src 패키지 경로를 포함하도록 설정
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
 from src.a2a_integration.a2a_lg_agent_executor import LangGraphWrappedA2AExecutor
 
 # TypedDict / Annotated 호환성 처리
@@ -175,6 +168,59 @@ class TestComplexAnnotations:
         assert result == {"field_a", "field_b"}, f"Expected {{'field_a', 'field_b'}}, got {result}"
 
 
+class TestFieldNameCache:
+    """입력 스키마 필드명 캐시 테스트"""
+
+    def test_second_call_uses_cache(self):
+        """두 번째 호출에서는 get_input_schema를 다시 호출하지 않음."""
+        class SimpleTD(TypedDict):
+            a: int
+            b: str
+
+        calls = []
+
+        class CountingGraph:
+            def get_input_schema(self):
+                calls.append(1)
+                return SimpleTD
+
+        ex = LangGraphWrappedA2AExecutor(graph=CountingGraph())
+        assert ex._get_graph_input_field_names() == {"a", "b"}
+        assert ex._get_graph_input_field_names() == {"a", "b"}
+        assert len(calls) == 1, f"Expected 1 schema lookup, got {len(calls)}"
+
+    def test_mutating_result_does_not_change_cache(self):
+        """반환된 집합을 수정해도 캐시는 변하지 않음."""
+        class SimpleTD(TypedDict):
+            a: int
+            b: str
+
+        ex = _make_executor_for_schema(SimpleTD)
+        result = ex._get_graph_input_field_names()
+        result.add("injected")
+        result.discard("a")
+        assert ex._get_graph_input_field_names() == {"a", "b"}
+
+    def test_failed_schema_lookup_is_not_cached(self):
+        """스키마 조회 실패(빈 결과)는 캐시하지 않고 다음 호출에서 재시도."""
+        class SimpleTD(TypedDict):
+            a: int
+
+        attempts = []
+
+        class FlakyGraph:
+            def get_input_schema(self):
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise RuntimeError("transient failure")
+                return SimpleTD
+
+        ex = LangGraphWrappedA2AExecutor(graph=FlakyGraph())
+        assert ex._get_graph_input_field_names() == set()
+        assert ex._get_graph_input_field_names() == {"a"}
+        assert len(attempts) == 2, f"Expected 2 schema lookups, got {len(attempts)}"
+
+
 if __name__ == "__main__":
     # 개별 실행 시 pytest 호출
     pytest.main([__file__, "-v"])
@@ -5,15 +5,8 @@ LangGraph State 실제 통합 테스트
 _get_graph_input_field_names()와 _build_graph_input_from_payload()가
 올바르게 동작하는지 검증합니다.
 """
-import os
-import sys
 import pytest
 
-# tests가 repo 루트에서 실행될 때 src 패키지 경로를 포함하도록 설정
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
 from src.a2a_integration.a2a_lg_agent_executor import LangGraphWrappedA2AExecutor
 from src.lg_agents.base.base_graph_state import BaseGraphState
 
@@ -0,0 +1,61 @@
+"""
+최종 보고서 JSON 다운로드 직렬화 테스트
+
+created_at/decided_at 같은 datetime 필드와 JSON 비호환 값이 포함된 payload가
+orjson 사용 여부와 관계없이 동일한 유효 JSON으로 직렬화되는지 검증합니다.
+"""
+import json
+import sys
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.hitl_web.api import _dumps_report_json
+
+
+def _make_payload() -> dict:
+    """다운로드 엔드포인트와 같은 형태의 테스트 payload."""
+    return {
+        "request_id": "req-1",
+        "title": "보고서",
+        "final_report": "# 결과",
+        "status": "approved",
+        "created_at": datetime(2025, 1, 2, 3, 4, 5),
+        "decided_at": datetime(2025, 1, 2, 3, 14, 5),
+        "score": Decimal("1.5"),
+    }
+
+
+def _expected() -> dict:
+    return {
+        "request_id": "req-1",
+        "title": "보고서",
+        "final_report": "# 결과",
+        "status": "approved",
+        "created_at": "2025-01-02T03:04:05",
+        "decided_at": "2025-01-02T03:14:05",
+        "score": "1.5",
+    }
+
+
+class TestReportJsonSerialization:
+    """보고서 JSON 직렬화 테스트"""
+
+    def test_datetime_fields_produce_valid_json(self):
+        """기본 경로(orjson 설치 시 orjson)에서 datetime 필드가 ISO 문자열로 직렬화."""
+        result = json.loads(_dumps_report_json(_make_payload()))
+        assert result == _expected(), f"Expected {_expected()}, got {result}"
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        """orjson이 없을 때 표준 json 폴백도 같은 결과를 생성."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        content = _dumps_report_json(_make_payload())
+        assert isinstance(content, str)
+        result = json.loads(content)
+        assert result == _expected(), f"Expected {_expected()}, got {result}"
+
+
+if __name__ == "__main__":
+    # 개별 실행 시 pytest 호출
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,47 @@
+"""
+WebSocketManager.broadcast 직렬화 회귀 테스트
+
+datetime 등 JSON 비호환 값이 포함된 브로드캐스트 페이로드가
+ISO 8601 문자열로 직렬화되고, 연결이 끊기지 않는지 검증합니다.
+"""
+import json
+from datetime import datetime
+
+import pytest
+
+from src.hitl_web.websocket_handler import WebSocketManager
+
+
+class FakeWebSocket:
+    """send_text 호출을 기록하는 테스트용 WebSocket."""
+
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(text)
+
+
+class TestBroadcastSerialization:
+    """브로드캐스트 페이로드 직렬화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_datetime_payload_keeps_connection(self):
+        """datetime 값이 compact ISO JSON으로 전송되고 연결이 유지됨."""
+        manager = WebSocketManager()
+        ws = FakeWebSocket()
+        manager.active_connections.add(ws)
+
+        completed_at = datetime.now()
+        await manager.broadcast({"completed_at": completed_at})
+
+        expected = json.dumps(
+            {"completed_at": completed_at.isoformat()}, separators=(",", ":")
+        )
+        assert ws.sent == [expected], f"Expected [{expected}], got {ws.sent}"
+        assert ws in manager.active_connections
+
+
+if __name__ == "__main__":
+    # 개별 실행 시 pytest 호출
+    pytest.main([__file__, "-v"])